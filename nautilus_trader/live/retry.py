@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import functools
+from collections import deque
 from collections.abc import Awaitable
 from collections.abc import Callable
 from typing import Generic, TypeVar
@@ -44,9 +46,34 @@ class RetryManager(Generic[T]):
     retry_check : Callable[[BaseException], None], optional
         A function that performs additional checks on the exception.
         If the function returns `False`, a retry will not be attempted.
+    retry_deadline_secs : float, optional
+        The overall time budget (seconds) for an operation including retries.
+        If the next retry would start after the deadline, a retry will not be attempted.
+    pool : RetryManagerPool, optional
+        The owning pool to share a retry backoff with (if enabled for the pool).
 
     """
 
+    __slots__ = (
+        "max_retries",
+        "retry_delay_secs",
+        "retries",
+        "exc_types",
+        "retry_check",
+        "retry_deadline_secs",
+        "_exc_match",
+        "_cancelled",
+        "_sleep_task",
+        "_owner",
+        "log",
+        "name",
+        "details",
+        "details_str",
+        "result",
+        "message",
+        "_active",
+    )
+
     def __init__(
         self,
         max_retries: int,
@@ -54,13 +81,20 @@ class RetryManager(Generic[T]):
         logger: Logger,
         exc_types: tuple[type[BaseException], ...],
         retry_check: Callable[[BaseException], bool] | None = None,
+        retry_deadline_secs: float | None = None,
+        pool: "RetryManagerPool | None" = None,
     ) -> None:
         self.max_retries = max_retries
         self.retry_delay_secs = retry_delay_secs
         self.retries = 0
         self.exc_types = exc_types
         self.retry_check = retry_check
-        self.cancel_event = asyncio.Event()
+        self.retry_deadline_secs = retry_deadline_secs
+        # `except` accepts a single class directly, avoiding the tuple walk
+        self._exc_match = exc_types[0] if len(exc_types) == 1 else exc_types
+        self._cancelled = False
+        self._sleep_task: asyncio.Task | None = None  # Only set during a retry delay
+        self._owner = pool
         self.log = logger
 
         self.name: str | None = None
@@ -68,6 +102,7 @@ class RetryManager(Generic[T]):
         self.details_str: str | None = None
         self.result: bool = False
         self.message: str | None = None
+        self._active = False  # Set by the owning pool while acquired
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__}(name='{self.name}', details={self.details}) at {hex(id(self))}>"
@@ -105,12 +140,25 @@ class RetryManager(Generic[T]):
             The result of the executed function, or `None` if the retries fail.
 
         """
-        self.name = name
-        self.details = details
+        if not self._start(name, details):
+            return None
 
         try:
+            # Hoist attribute lookups out of the retry loop
+            exc_types = self._exc_match
+            retry_check = self.retry_check
+            max_retries = self.max_retries
+            retry_delay_secs = self.retry_delay_secs
+            owner = self._owner
+            loop = asyncio.get_running_loop()
+            deadline = (
+                loop.time() + self.retry_deadline_secs
+                if self.retry_deadline_secs is not None
+                else None
+            )
+
             while True:
-                if self.cancel_event.is_set():
+                if owner is not None and not await self._hold_off(owner, loop, deadline):
                     self._cancel()
                     return None
 
@@ -118,21 +166,24 @@ class RetryManager(Generic[T]):
                     response = await func(*args, **kwargs)
                     self.result = True
                     return response  # Successful request
-                except self.exc_types as e:
+                except exc_types as e:
                     self.log.warning(repr(e))
                     if (
-                        (self.retry_check and not self.retry_check(e))
-                        or not self.max_retries
-                        or self.retries >= self.max_retries
+                        (retry_check and not retry_check(e))
+                        or not max_retries
+                        or self.retries >= max_retries
+                        or (deadline is not None and loop.time() + retry_delay_secs >= deadline)
                     ):
-                        self._log_error()
-                        self.result = False
-                        self.message = str(e)
+                        self._fail(e)
                         return None  # Operation failed
 
                     self.retries += 1
                     self._log_retry()
-                    await asyncio.sleep(self.retry_delay_secs)
+                    if owner is not None:
+                        owner._backoff_until = loop.time() + retry_delay_secs
+                    if not await self._sleep(retry_delay_secs):
+                        self._cancel()
+                        return None
         except asyncio.CancelledError:
             self._cancel()
             return None
@@ -140,21 +191,84 @@ class RetryManager(Generic[T]):
     def cancel(self) -> None:
         """
         Cancel the retry operation.
+
+        A pending retry delay is interrupted immediately, otherwise any in-flight
+        request is allowed to complete and no further attempts are made.
+
         """
         self.log.debug(f"Canceling {self!r}")
-        self.cancel_event.set()
+        self._cancelled = True
+        task = self._sleep_task
+        if task is not None and not task.done():
+            self._sleep_task = None  # Signals the interrupt came from `cancel()`
+            task.cancel()
 
     def clear(self) -> None:
         """
         Clear all state from this retry manager.
         """
         self.retries = 0
+        self._cancelled = False
         self.name = None
         self.details = None
         self.details_str = None
         self.result = False
         self.message = None
 
+    def _start(self, name: str, details: list[object] | None) -> bool:
+        # Common run prologue, returns `False` if canceled before starting
+        self.name = name
+        self.details = details
+        self.details_str = None  # Formatted lazily by the log sites
+
+        if self._cancelled:
+            self._cancel()
+            return False
+
+        return True
+
+    async def _hold_off(
+        self,
+        owner: "RetryManagerPool",
+        loop: asyncio.AbstractEventLoop,
+        deadline: float | None,
+    ) -> bool:
+        # Hold off while a sibling manager is backing off from a failure (clamped to
+        # the deadline), returns `False` if canceled before or during the hold off
+        backoff_until = owner._backoff_until
+        if deadline is not None:
+            backoff_until = min(backoff_until, deadline)
+
+        backoff_secs = backoff_until - loop.time()
+        if backoff_secs <= 0:
+            return not self._cancelled
+
+        return await self._sleep(backoff_secs)
+
+    async def _sleep(self, delay_secs: float) -> bool:
+        # Returns `False` if canceled before or during the delay
+        if self._cancelled:
+            return False
+
+        task = asyncio.current_task()
+        self._sleep_task = task
+        try:
+            await asyncio.sleep(delay_secs)
+        except asyncio.CancelledError:
+            if self._sleep_task is not None or task is None:
+                raise  # Canceled externally
+            task.uncancel()
+            return False
+        finally:
+            self._sleep_task = None
+
+        return True
+
+    def _fail(self, e: BaseException) -> None:
+        self._log_error()
+        self.result = False
+        self.message = str(e)
+
     def _cancel(self) -> None:
         self.log.warning(f"Canceled retry for '{self.name}'")
         self.result = False
@@ -172,15 +286,70 @@ class RetryManager(Generic[T]):
         )
 
     def _details_str(self) -> str:
-        if not self.details:
-            return ""
-
-        if not self.details_str:
-            self.details_str = ": " + ", ".join([repr(x) for x in self.details])
+        if self.details_str is None:
+            # Formatted at most once per run, only when a log site needs it
+            self.details_str = (": " + ", ".join(map(repr, self.details))) if self.details else ""
 
         return self.details_str
 
 
+class NoRetryManager(RetryManager[T]):
+    """
+    Provides a `RetryManager` specialized for when retries are disabled.
+
+    Each operation is attempted exactly once, without the retry loop. Failures are
+    logged and recorded in the same way as for `RetryManager`.
+
+    """
+
+    __slots__ = ()
+
+    async def run(
+        self,
+        name: str,
+        details: list[object] | None,
+        func: Callable[..., Awaitable[T]],
+        *args,
+        **kwargs,
+    ) -> T | None:
+        """
+        Execute the given `func` once without retries.
+
+        Parameters
+        ----------
+        name : str
+            The name of the operation to run.
+        details : list[object], optional
+            The operation details such as identifiers.
+        func : Callable[..., Awaitable[T]]
+            The function to execute.
+        args : Any
+            Positional arguments to pass to the function `func`.
+        kwargs : Any
+            Keyword arguments to pass to the function `func`.
+
+        Returns
+        -------
+        T | None
+            The result of the executed function, or `None` if the operation fails.
+
+        """
+        if not self._start(name, details):
+            return None
+
+        try:
+            response = await func(*args, **kwargs)
+            self.result = True
+            return response  # Successful request
+        except self._exc_match as e:
+            self.log.warning(repr(e))
+            self._fail(e)
+            return None  # Operation failed
+        except asyncio.CancelledError:
+            self._cancel()
+            return None
+
+
 class RetryManagerPool:
     """
     Provides a pool of `RetryManager`s.
@@ -200,9 +369,30 @@ class RetryManagerPool:
     retry_check : Callable[[BaseException], None], optional
         A function that performs additional checks on the exception.
         If the function returns `False`, a retry will not be attempted.
+    retry_deadline_secs : float, optional
+        The overall time budget (seconds) for an operation including retries.
+        If the next retry would start after the deadline, a retry will not be attempted.
+    share_backoff : bool, default False
+        If a retry by one manager should hold off new attempts by the other managers
+        in the pool until its retry delay has elapsed.
 
     """
 
+    __slots__ = (
+        "max_retries",
+        "retry_delay_secs",
+        "logger",
+        "exc_types",
+        "retry_check",
+        "retry_deadline_secs",
+        "pool_size",
+        "_backoff_until",
+        "_factory",
+        "_all_managers",
+        "_pool",
+        "_current_managers",
+    )
+
     def __init__(
         self,
         pool_size: int,
@@ -211,50 +401,95 @@ class RetryManagerPool:
         logger: Logger,
         exc_types: tuple[type[BaseException], ...],
         retry_check: Callable[[BaseException], bool] | None = None,
+        retry_deadline_secs: float | None = None,
+        share_backoff: bool = False,
     ) -> None:
         self.max_retries = max_retries
         self.retry_delay_secs = retry_delay_secs
         self.logger = logger
         self.exc_types = exc_types
         self.retry_check = retry_check
+        self.retry_deadline_secs = retry_deadline_secs
         self.pool_size = pool_size
-        self._pool: list[RetryManager] = [self._create_manager() for _ in range(pool_size)]
-        self._lock = asyncio.Lock()
-        self._current_manager: RetryManager | None = None
-        self._active_managers: set[RetryManager] = set()
+        self._backoff_until = 0.0  # Event loop time until which managers hold off
+        # Specialize the manager type when retries are disabled
+        manager_cls = NoRetryManager if max_retries == 0 else RetryManager
+        self._factory: Callable[[], RetryManager] = functools.partial(
+            manager_cls,
+            max_retries,
+            retry_delay_secs,
+            logger,
+            exc_types,
+            retry_check,
+            retry_deadline_secs,
+            self if share_backoff else None,
+        )
+        self._all_managers: set[RetryManager] = set()
+        self._pool: deque[RetryManager] = deque()  # Grows lazily up to `pool_size`
+        # Managers acquired via the context manager, per task (nested entries are stacked)
+        self._current_managers: dict[asyncio.Task | None, list[RetryManager]] = {}
 
     def _create_manager(self) -> RetryManager:
-        return RetryManager(
-            max_retries=self.max_retries,
-            retry_delay_secs=self.retry_delay_secs,
-            logger=self.logger,
-            exc_types=self.exc_types,
-            retry_check=self.retry_check,
-        )
+        retry_manager = self._factory()
+        self._all_managers.add(retry_manager)
+        return retry_manager
+
+    def _context_key(self) -> asyncio.Task | None:
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None  # No running event loop
+
+    def __enter__(self) -> RetryManager:
+        """
+        Context manager entry.
+
+        Acquires a `RetryManager` from the pool (non-blocking).
+
+        """
+        retry_manager = self.acquire()
+        self._current_managers.setdefault(self._context_key(), []).append(retry_manager)
+        return retry_manager
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Context manager exit.
+
+        Releases the `RetryManager` acquired by the current task back into the pool
+        (non-blocking).
+
+        """
+        key = self._context_key()
+        managers = self._current_managers.get(key)
+        if not managers:
+            return
+
+        retry_manager = managers.pop()
+        if not managers:
+            # Drop reference to avoid lingering state issues
+            del self._current_managers[key]
+
+        self.release(retry_manager)
 
     async def __aenter__(self) -> RetryManager:
         """
         Asynchronous context manager entry.
 
-        Acquires a `RetryManager` from the pool.
+        Acquires a `RetryManager` from the pool. This never suspends, as acquisition
+        is non-blocking.
 
         """
-        self._current_manager = await self.acquire()
-        return self._current_manager
+        return self.__enter__()
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
         """
         Asynchronous context manager exit.
 
-        Releases the `RetryManager` back into the pool.
+        Releases the `RetryManager` back into the pool. This never suspends, as
+        release is non-blocking.
 
         """
-        try:
-            if self._current_manager:
-                await self.release(self._current_manager)
-        finally:
-            # Drop reference to avoid lingering state issues
-            self._current_manager = None
+        self.__exit__(exc_type, exc_value, traceback)
 
     def shutdown(self) -> None:
         """
@@ -266,37 +501,39 @@ class RetryManagerPool:
 
         """
         self.logger.info("Shutting down retry manager pool")
-        for retry_manager in self._active_managers:
-            retry_manager.cancel()
-        self._active_managers.clear()
+        for retry_manager in self._all_managers:
+            if retry_manager._active:
+                retry_manager.cancel()
 
-    async def acquire(self) -> RetryManager:
+    def acquire(self) -> RetryManager:
         """
         Acquire a `RetryManager` from the pool, or creates a new one if the pool is
-        empty.
+        empty (managers are created on demand rather than pre-allocated).
+
+        This method is non-blocking, there are no suspension points between checking
+        and popping from the pool so no lock is required on the event loop.
 
         Returns
         -------
         RetryManager
 
         """
-        async with self._lock:
-            if self._pool:
-                # Pop the most recently used manager and clear its state
-                retry_manager = self._pool.pop()
-                retry_manager.clear()
-            else:
-                # Create new manager if pool is empty
-                retry_manager = self._create_manager()
-
-            self._active_managers.add(retry_manager)
-            return retry_manager
-
-    async def release(self, retry_manager: RetryManager) -> None:
+        if self._pool:
+            # Pop the most recently used manager (state was cleared on release)
+            retry_manager = self._pool.pop()
+        else:
+            # Create new manager if pool is empty
+            retry_manager = self._create_manager()
+
+        retry_manager._active = True
+        return retry_manager
+
+    def release(self, retry_manager: RetryManager) -> None:
         """
         Release the given `retry_manager` back into the pool.
 
-        If the pool is already full, the `retry_manager` will be dropped.
+        The state of the `retry_manager` is cleared only if it is returned to the pool,
+        if the pool is already full then the `retry_manager` will be dropped.
 
         Parameters
         ----------
@@ -304,12 +541,11 @@ class RetryManagerPool:
             The manager to be returned to the pool.
 
         """
-        async with self._lock:
-            self._active_managers.discard(retry_manager)
-            if len(self._pool) < self.pool_size:
-                # Append the manager to the pool without clearing its state,
-                # state is cleared on acquisition to avoid potential race conditions.
-                self._pool.append(retry_manager)
-            else:
-                # Pool already at capacity
-                self.logger.debug(f"Discarding extra {retry_manager!r}")
+        retry_manager._active = False
+        if len(self._pool) < self.pool_size:
+            retry_manager.clear()
+            self._pool.append(retry_manager)
+        else:
+            # Pool already at capacity (rare overflow path)
+            self._all_managers.discard(retry_manager)
+            self.logger.debug(f"Discarding extra {retry_manager!r}")
@@ -20,6 +20,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from nautilus_trader.common.component import Logger
+from nautilus_trader.live.retry import NoRetryManager
 from nautilus_trader.live.retry import RetryManager
 from nautilus_trader.live.retry import RetryManagerPool
 
@@ -107,7 +108,77 @@ async def test_retry_manager_exhausts_retries(mock_logger):
     # Assert
     assert mock_func.await_count == 3
     assert mock_logger.warning.call_count == 5
+    mock_logger.warning.assert_any_call("Retrying 2/2 for 'test' in 0.1s: 'ID123'")
+    mock_logger.error.assert_called_once_with("Failed on 'test': 'ID123'")
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_stops_retrying_at_deadline(mock_logger):
+    # Arrange
+    retry_manager = RetryManager(
+        max_retries=10,
+        retry_delay_secs=0.2,
+        exc_types=(Exception,),
+        logger=mock_logger,
+        retry_deadline_secs=0.5,
+    )
+    mock_func = AsyncMock(side_effect=Exception("Test Error"))
+
+    # Act
+    await retry_manager.run(name="test", details=["ID123"], func=mock_func)
+
+    # Assert
+    assert mock_func.await_count == 3  # Next retry would start after the deadline
+    mock_logger.error.assert_called_once()
+    assert retry_manager.result is False
+    assert retry_manager.message == "Test Error"
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_with_retries_disabled(mock_logger):
+    # Arrange
+    retry_manager = RetryManager(
+        max_retries=0,
+        retry_delay_secs=0.1,
+        exc_types=(ValueError,),
+        logger=mock_logger,
+    )
+    mock_func = AsyncMock(side_effect=ValueError("Test Error"))
+
+    # Act
+    await retry_manager.run(name="test", details=["ID123"], func=mock_func)
+
+    # Assert
+    assert mock_func.await_count == 1
+    assert mock_logger.warning.call_count == 1
     mock_logger.error.assert_called_once()
+    assert retry_manager.result is False
+    assert retry_manager.message == "Test Error"
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_pool_with_retries_disabled_uses_no_retry_manager(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=1,
+        max_retries=0,
+        retry_delay_secs=0.1,
+        exc_types=(ValueError,),
+        logger=mock_logger,
+        retry_check=lambda e: True,  # Cannot retry regardless with `max_retries` of 0
+    )
+    mock_func = AsyncMock(side_effect=ValueError("Test Error"))
+
+    # Act, Assert
+    async with pool as retry_manager:
+        await retry_manager.run(name="test", details=["ID123"], func=mock_func)
+        assert retry_manager.result is False
+        assert retry_manager.message == "Test Error"
+
+    assert type(retry_manager) is NoRetryManager
+    assert mock_func.await_count == 1
+    assert mock_logger.warning.call_count == 1
+    mock_logger.error.assert_called_once_with("Failed on 'test': 'ID123'")
 
 
 @pytest.mark.asyncio
@@ -123,11 +194,61 @@ async def test_retry_manager_pool_acquire_and_release(mock_logger):
     )
 
     # Act, Assert
+    assert len(pool._pool) == 0  # Managers are created lazily
     async with pool as retry_manager:
         assert isinstance(retry_manager, RetryManager)
-        assert len(pool._pool) == pool_size - 1
+        assert len(pool._pool) == 0
+
+    assert len(pool._pool) == 1
+
+    async with pool as retry_manager2:
+        assert retry_manager2 is retry_manager  # Reuses pooled manager
+        assert len(pool._pool) == 0
+
+    assert len(pool._pool) == 1
+
+
+def test_retry_manager_pool_acquire_and_release_without_event_loop(mock_logger):
+    # Arrange
+    pool_size = 2
+    pool = RetryManagerPool(
+        pool_size=pool_size,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+
+    # Act
+    retry_manager1 = pool.acquire()
+    retry_manager2 = pool.acquire()
 
+    # Assert
+    assert isinstance(retry_manager1, RetryManager)
+    assert len(pool._pool) == 0
+    pool.release(retry_manager1)
+    pool.release(retry_manager2)
     assert len(pool._pool) == pool_size
+    assert pool.acquire() is retry_manager2  # LIFO reuse
+
+
+def test_retry_manager_pool_sync_context_manager(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=1,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+
+    # Act, Assert
+    with pool as retry_manager:
+        assert isinstance(retry_manager, RetryManager)
+        assert retry_manager._active
+
+    assert not retry_manager._active
+    assert list(pool._pool) == [retry_manager]
 
 
 @pytest.mark.asyncio
@@ -151,6 +272,115 @@ async def test_retry_manager_pool_create_new_when_empty(mock_logger):
     assert len(pool._pool) == pool_size
 
 
+def test_retry_manager_pool_release_drops_overflow_manager(mock_logger):
+    # Arrange
+    pool_size = 1
+    pool = RetryManagerPool(
+        pool_size=pool_size,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+    retry_manager1 = pool.acquire()
+    retry_manager2 = pool.acquire()
+
+    # Act
+    pool.release(retry_manager1)
+    pool.release(retry_manager2)
+
+    # Assert
+    assert list(pool._pool) == [retry_manager1]
+    assert pool._all_managers == {retry_manager1}
+
+
+def test_retry_manager_pool_release_clears_state_only_when_retained(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=1,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+    retry_manager1 = pool.acquire()
+    retry_manager2 = pool.acquire()
+    for retry_manager in (retry_manager1, retry_manager2):
+        retry_manager.name = "test"
+        retry_manager.result = True
+
+    # Act
+    pool.release(retry_manager1)
+    pool.release(retry_manager2)
+
+    # Assert
+    assert retry_manager1.name is None  # Retained in pool
+    assert retry_manager1.result is False
+    assert retry_manager2.name == "test"  # Dropped without clearing
+    assert retry_manager2.result is True
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_pool_concurrent_contexts_release_own_manager(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=2,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+    entered = asyncio.Event()
+    first_exited = asyncio.Event()
+    managers: dict[str, RetryManager] = {}
+
+    async def first():
+        async with pool as retry_manager:
+            managers["first"] = retry_manager
+            await entered.wait()
+        first_exited.set()
+
+    async def second():
+        async with pool as retry_manager:
+            managers["second"] = retry_manager
+            retry_manager.result = True
+            entered.set()
+            await first_exited.wait()
+            # Assert: still held by this task after the other context exits
+            assert retry_manager._active
+            assert retry_manager.result is True
+
+    # Act
+    await asyncio.gather(first(), second())
+
+    # Assert
+    assert managers["first"] is not managers["second"]
+    assert set(pool._pool) == {managers["first"], managers["second"]}
+    assert not pool._current_managers
+
+
+def test_retry_manager_pool_release_tolerates_double_release_of_dropped_manager(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=1,
+        max_retries=2,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+    retry_manager1 = pool.acquire()
+    retry_manager2 = pool.acquire()
+    pool.release(retry_manager1)
+    pool.release(retry_manager2)  # Dropped as pool is full
+
+    # Act
+    pool.release(retry_manager2)
+
+    # Assert
+    assert list(pool._pool) == [retry_manager1]
+    assert pool._all_managers == {retry_manager1}
+
+
 @pytest.mark.asyncio
 async def test_retry_manager_with_retry_check(mock_logger):
     # Arrange
@@ -202,6 +432,226 @@ async def test_retry_manager_cancellation(mock_logger):
     task.cancel()
 
 
+@pytest.mark.asyncio
+async def test_retry_manager_cancellation_during_retry_delay(mock_logger):
+    # Arrange
+    retry_manager = RetryManager(
+        max_retries=5,
+        retry_delay_secs=10.0,
+        logger=mock_logger,
+        exc_types=(Exception,),
+    )
+    mock_func = AsyncMock(side_effect=Exception("Test Error"))
+
+    # Act
+    task = asyncio.create_task(
+        retry_manager.run(name="test", details=["ID123"], func=mock_func),
+    )
+    await asyncio.sleep(0.1)
+    retry_manager.cancel()
+    await asyncio.wait_for(task, timeout=1.0)  # Does not wait for the full delay
+
+    # Assert
+    assert mock_func.await_count == 1
+    assert retry_manager.result is False
+    assert retry_manager.message == "Canceled retry"
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_cancellation_during_request_lets_request_complete(mock_logger):
+    # Arrange
+    retry_manager = RetryManager(
+        max_retries=5,
+        retry_delay_secs=0.1,
+        logger=mock_logger,
+        exc_types=(Exception,),
+    )
+    completed: list[bool] = []
+
+    async def in_flight_request():
+        await asyncio.sleep(0.2)
+        completed.append(True)
+        return "response"
+
+    async def run_operation():
+        response = await retry_manager.run(name="test", details=None, func=in_flight_request)
+        await asyncio.sleep(0)  # Task remains usable after cancel
+        return response
+
+    # Act
+    task = asyncio.create_task(run_operation())
+    await asyncio.sleep(0.05)
+    retry_manager.cancel()
+    response = await asyncio.wait_for(task, timeout=1.0)
+
+    # Assert
+    assert completed == [True]  # In-flight request was not interrupted
+    assert response == "response"
+    assert task.cancelling() == 0
+    assert retry_manager.result is True
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_cancellation_during_failing_request_stops_retries(mock_logger):
+    # Arrange
+    retry_manager = RetryManager(
+        max_retries=5,
+        retry_delay_secs=0.1,
+        logger=mock_logger,
+        exc_types=(Exception,),
+    )
+    call_count: list[int] = []
+
+    async def failing_request():
+        call_count.append(1)
+        await asyncio.sleep(0.2)
+        raise Exception("Test Error")
+
+    # Act
+    task = asyncio.create_task(
+        retry_manager.run(name="test", details=None, func=failing_request),
+    )
+    await asyncio.sleep(0.05)
+    retry_manager.cancel()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    # Assert
+    assert len(call_count) == 1
+    assert retry_manager.result is False
+    assert retry_manager.message == "Canceled retry"
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_clear_resets_cancellation(mock_logger):
+    # Arrange
+    retry_manager = RetryManager(
+        max_retries=3,
+        retry_delay_secs=0.1,
+        logger=mock_logger,
+        exc_types=(Exception,),
+    )
+    retry_manager.cancel()
+    mock_func = AsyncMock()
+
+    # Act
+    retry_manager.clear()
+    await retry_manager.run(name="test", details=None, func=mock_func)
+
+    # Assert
+    mock_func.assert_awaited_once()
+    assert retry_manager.result is True
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_pool_shares_backoff_between_managers(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=2,
+        max_retries=1,
+        retry_delay_secs=0.3,
+        exc_types=(Exception,),
+        logger=mock_logger,
+        share_backoff=True,
+    )
+    loop = asyncio.get_running_loop()
+    call_times: list[float] = []
+
+    async def record_call():
+        call_times.append(loop.time())
+
+    retry_manager1 = pool.acquire()
+    retry_manager2 = pool.acquire()
+
+    # Act
+    task = asyncio.create_task(
+        retry_manager1.run(
+            name="failing",
+            details=None,
+            func=AsyncMock(side_effect=[Exception("Test Error"), None]),
+        ),
+    )
+    await asyncio.sleep(0.05)  # First manager fails and begins backing off
+    backoff_until = pool._backoff_until
+    await retry_manager2.run(name="sibling", details=None, func=record_call)
+    await task
+
+    # Assert
+    assert backoff_until > 0.0
+    assert call_times[0] >= backoff_until  # Sibling held off until backoff expired
+    assert retry_manager1.result is True
+    assert retry_manager2.result is True
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_pool_does_not_share_backoff_by_default(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=2,
+        max_retries=1,
+        retry_delay_secs=0.3,
+        exc_types=(Exception,),
+        logger=mock_logger,
+    )
+    loop = asyncio.get_running_loop()
+    call_times: list[float] = []
+
+    async def record_call():
+        call_times.append(loop.time())
+
+    retry_manager1 = pool.acquire()
+    retry_manager2 = pool.acquire()
+
+    # Act
+    task = asyncio.create_task(
+        retry_manager1.run(
+            name="failing",
+            details=None,
+            func=AsyncMock(side_effect=[Exception("Test Error"), None]),
+        ),
+    )
+    await asyncio.sleep(0.05)  # First manager fails and begins its retry delay
+    start = loop.time()
+    await retry_manager2.run(name="sibling", details=None, func=record_call)
+    await task
+
+    # Assert
+    assert pool._backoff_until == 0.0
+    assert call_times[0] - start < 0.1  # Sibling not held off
+
+
+@pytest.mark.asyncio
+async def test_retry_manager_shared_backoff_clamped_to_deadline(mock_logger):
+    # Arrange
+    pool = RetryManagerPool(
+        pool_size=1,
+        max_retries=1,
+        retry_delay_secs=0.1,
+        exc_types=(Exception,),
+        logger=mock_logger,
+        retry_deadline_secs=0.3,
+        share_backoff=True,
+    )
+    loop = asyncio.get_running_loop()
+    pool._backoff_until = loop.time() + 10.0  # Long sibling backoff
+    call_times: list[float] = []
+
+    async def record_call():
+        call_times.append(loop.time())
+
+    retry_manager = pool.acquire()
+
+    # Act
+    start = loop.time()
+    await asyncio.wait_for(
+        retry_manager.run(name="test", details=None, func=record_call),
+        timeout=1.0,
+    )
+
+    # Assert
+    assert call_times[0] - start < 0.5  # Held off only until the deadline
+    assert retry_manager.result is True
+
+
 @pytest.mark.asyncio
 async def test_retry_manager_pool_shutdown(mock_logger):
     # Arrange
@@ -231,6 +681,6 @@ async def test_retry_manager_pool_shutdown(mock_logger):
 
         # Assert
         await task
-        assert len(pool._pool) == 1
+        assert len(pool._pool) == 0  # Only the active manager has been created
         assert retry_manager.result is False
         assert retry_manager.message == "Canceled retry"